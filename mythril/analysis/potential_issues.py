@@ -1,3 +1,5 @@
+from typing import List
+
 from mythril.analysis.report import Issue
 from mythril.analysis.solver import get_transaction_sequence
 from mythril.exceptions import UnsatError
@@ -81,15 +83,16 @@ def check_potential_issues(state: GlobalState) -> None:
     :return:
     """
     annotation = get_potential_issues_annotation(state)
+    unsat_potential_issues = []  # type: List[PotentialIssue]
     for potential_issue in annotation.potential_issues:
         try:
             transaction_sequence = get_transaction_sequence(
                 state, state.world_state.constraints + potential_issue.constraints
             )
         except UnsatError:
+            unsat_potential_issues.append(potential_issue)
             continue
 
-        annotation.potential_issues.remove(potential_issue)
         potential_issue.detector.cache.add(potential_issue.address)
         potential_issue.detector.issues.append(
             Issue(
@@ -106,3 +109,4 @@ def check_potential_issues(state: GlobalState) -> None:
                 transaction_sequence=transaction_sequence,
             )
         )
+    annotation.potential_issues[:] = unsat_potential_issues
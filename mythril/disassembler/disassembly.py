@@ -23,7 +23,8 @@ class Disassembly(object):
         :param enable_online_lookup:
         """
         self.bytecode = code
-        self.instruction_list = asm.disassemble(util.safe_decode(code))
+        self.instruction_list = []  # type: List[Dict]
+        self.opcode_array = ()  # type: Tuple[str, ...]
 
         self.func_hashes = []  # type: List[str]
         self.function_name_to_address = {}  # type: Dict[str, int]
@@ -37,6 +38,10 @@ class Disassembly(object):
         # control if you want to have online signature hash lookups
         signatures = SignatureDB(enable_online_lookup=self.enable_online_lookup)
         self.instruction_list = asm.disassemble(util.safe_decode(bytecode))
+        # Op codes by instruction index, for fast lookups during execution
+        self.opcode_array = tuple(
+            instruction["opcode"] for instruction in self.instruction_list
+        )
         # Need to take from PUSH1 to PUSH4 because solc seems to remove excess 0s at the beginning for optimizing
         jump_table_indices = asm.find_op_code_sequence(
             [("PUSH1", "PUSH2", "PUSH3", "PUSH4"), ("EQ",)], self.instruction_list
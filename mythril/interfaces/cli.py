@@ -464,6 +464,11 @@ def create_analyzer_parser(analyzer_parser: ArgumentParser):
         action="store_true",
         help="enable coverage based search strategy",
     )
+    options.add_argument(
+        "--enable-sat-cache",
+        action="store_true",
+        help="cache constraint satisfiability results on disk across runs",
+    )
     options.add_argument(
         "--custom-modules-directory",
         help="designates a separate directory to search for custom analysis modules",
@@ -663,6 +668,7 @@ def execute_command(
             solver_timeout=args.solver_timeout,
             requires_dynld=not args.no_onchain_storage_access,
             enable_coverage_strategy=args.enable_coverage_strategy,
+            enable_sat_cache=args.enable_sat_cache,
             custom_modules_directory=args.custom_modules_directory
             if args.custom_modules_directory
             else "",
@@ -98,8 +98,9 @@ def get_callee_address(
     except TypeError:
         log.debug("Symbolic call encountered")
 
-        match = re.search(r"Storage\[(\d+)\]", str(simplify(symbolic_to_address)))
-        log.debug("CALL to: " + str(simplify(symbolic_to_address)))
+        callee_expression = str(simplify(symbolic_to_address))
+        match = re.search(r"Storage\[(\d+)\]", callee_expression)
+        log.debug("CALL to: %s", callee_expression)
 
         if match is None or dynamic_loader is None:
             return symbolic_to_address
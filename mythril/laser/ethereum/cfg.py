@@ -34,6 +34,16 @@ class NodeFlags(Flags):
 class Node:
     """The representation of a call graph node."""
 
+    __slots__ = (
+        "contract_name",
+        "start_addr",
+        "states",
+        "constraints",
+        "function_name",
+        "flags",
+        "uid",
+    )
+
     def __init__(
         self,
         contract_name: str,
@@ -87,6 +97,8 @@ class Node:
 class Edge:
     """The respresentation of a call graph edge."""
 
+    __slots__ = "node_from", "node_to", "type", "condition"
+
     def __init__(
         self,
         node_from: int,
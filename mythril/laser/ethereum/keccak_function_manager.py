@@ -32,6 +32,8 @@ class KeccakFunctionManager:
     def __init__(self):
         self.store_function = {}  # type: Dict[int, Tuple[Function, Function]]
         self.interval_hook_for_size = {}  # type: Dict[int, int]
+        self.interval_bounds_for_size = {}  # type: Dict[int, Tuple[BitVec, BitVec]]
+        self._hash_alignment = symbol_factory.BitVecVal(64, 256)
         self._index_counter = TOTAL_PARTS - 34534
         self.hash_result_store = {}  # type: Dict[int, List[BitVec]]
         self.quick_inverse = {}  # type: Dict[BitVec, BitVec]  # This is for VMTests
@@ -85,10 +87,11 @@ class KeccakFunctionManager:
         length = data.size()
         func, inverse = self.get_function(length)
 
-        condition = self._create_condition(func_input=data)
-        self.quick_inverse[func(data)] = data
-        self.hash_result_store[length].append(func(data))
-        return func(data), condition
+        keccak = func(data)
+        condition = self._create_condition(func_input=data, func_output=keccak)
+        self.quick_inverse[keccak] = data
+        self.hash_result_store[length].append(keccak)
+        return keccak, condition
 
     def get_concrete_hash_data(self, model) -> Dict[int, List[Optional[int]]]:
         """
@@ -108,14 +111,17 @@ class KeccakFunctionManager:
                     continue
         return concrete_hashes
 
-    def _create_condition(self, func_input: BitVec) -> Bool:
+    def _get_interval_bounds(self, length: int) -> Tuple[BitVec, BitVec]:
         """
-        Creates the constraints for hash
-        :param func_input: input of the hash
-        :return: condition
+        Returns the bounds of the interval reserved for hashes of the given input size
+        :param length: input size
+        :return: tuple of lower bound and upper bound
         """
-        length = func_input.size()
-        func, inv = self.get_function(length)
+        try:
+            return self.interval_bounds_for_size[length]
+        except KeyError:
+            pass
+
         try:
             index = self.interval_hook_for_size[length]
         except KeyError:
@@ -126,11 +132,29 @@ class KeccakFunctionManager:
         lower_bound = index * PART
         upper_bound = lower_bound + PART
 
+        bounds = (
+            symbol_factory.BitVecVal(lower_bound, 256),
+            symbol_factory.BitVecVal(upper_bound, 256),
+        )
+        self.interval_bounds_for_size[length] = bounds
+        return bounds
+
+    def _create_condition(self, func_input: BitVec, func_output: BitVec) -> Bool:
+        """
+        Creates the constraints for hash
+        :param func_input: input of the hash
+        :param func_output: the application of the keccak function on func_input
+        :return: condition
+        """
+        length = func_input.size()
+        _, inv = self.get_function(length)
+        lower_bound, upper_bound = self._get_interval_bounds(length)
+
         cond = And(
-            inv(func(func_input)) == func_input,
-            ULE(symbol_factory.BitVecVal(lower_bound, 256), func(func_input)),
-            ULT(func(func_input), symbol_factory.BitVecVal(upper_bound, 256)),
-            URem(func(func_input), symbol_factory.BitVecVal(64, 256)) == 0,
+            inv(func_output) == func_input,
+            ULE(lower_bound, func_output),
+            ULT(func_output, upper_bound),
+            URem(func_output, self._hash_alignment) == 0,
         )
         return cond
 
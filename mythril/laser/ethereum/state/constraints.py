@@ -1,10 +1,23 @@
 """This module contains the class used to represent state-change constraints in
 the call graph."""
 
-from mythril.laser.smt import Solver, Bool, symbol_factory, simplify
+from mythril.laser.smt import Bool, symbol_factory, simplify
+from mythril.laser.smt.solver import IncrementalSolver
+from mythril.support.sat_cache import sat_cache
 
 from typing import Iterable, List, Optional, Union
-from z3 import unsat
+from z3 import sat, unsat
+import z3
+
+_incremental_solver = None  # type: Optional[IncrementalSolver]
+
+
+def get_incremental_solver() -> IncrementalSolver:
+    """Returns the solver shared by all is_possible queries"""
+    global _incremental_solver
+    if _incremental_solver is None:
+        _incremental_solver = IncrementalSolver()
+    return _incremental_solver
 
 
 class Constraints(list):
@@ -38,18 +51,56 @@ class Constraints(list):
 
         if self._is_possible is not None:
             return self._is_possible
-        solver = Solver()
+        constraints = [
+            symbol_factory.Bool(constraint)
+            if isinstance(constraint, bool)
+            else constraint
+            for constraint in self
+        ]
+        if self._is_trivially_unsat(constraints):
+            self._is_possible = False
+            return False
+
+        cache_key = None
+        if sat_cache.enabled:
+            cache_key = sat_cache.get_key(constraint.raw for constraint in constraints)
+            cached_result = sat_cache.get(cache_key)
+            if cached_result is not None:
+                self._is_possible = cached_result
+                return cached_result
+
+        solver = get_incremental_solver()
         solver.set_timeout(self._default_timeout)
-        for constraint in self[:]:
-            constraint = (
-                symbol_factory.Bool(constraint)
-                if isinstance(constraint, bool)
-                else constraint
-            )
-            solver.add(constraint)
-        self._is_possible = solver.check() != unsat
+        result = solver.check_constraints(constraints)
+        self._is_possible = result != unsat
+
+        # Timeouts are not cached, a later query with more time might decide them
+        if cache_key is not None and result in (sat, unsat):
+            sat_cache.add(cache_key, self._is_possible)
         return self._is_possible
 
+    @staticmethod
+    def _is_trivially_unsat(constraints: List[Bool]) -> bool:
+        """Checks whether the newest constraint is false or the negation of a previous
+        constraint, which can be decided without invoking the solver.
+
+        :param constraints: The list of constraints
+        :return: True if the constraints are unsatisfiable, False if undecided
+        """
+        if not constraints:
+            return False
+        newest = constraints[-1].raw
+        if isinstance(newest, bool):
+            return not newest
+        if z3.is_false(newest):
+            return True
+
+        negation = z3.simplify(z3.Not(newest))
+        for constraint in constraints[:-1]:
+            if not isinstance(constraint.raw, bool) and negation.eq(constraint.raw):
+                return True
+        return False
+
     def append(self, constraint: Union[bool, Bool]) -> None:
         """
 
@@ -104,15 +155,23 @@ class Constraints(list):
         constraints_list = super(Constraints, self).__add__(constraints_list)
         return Constraints(constraint_list=constraints_list, is_possible=None)
 
+    def extend(self, constraints: Iterable[Union[bool, Bool]]) -> None:
+        """
+
+        :param constraints: The constraints to be appended in place
+        """
+        if not isinstance(constraints, Constraints):
+            constraints = self._get_smt_bool_list(constraints)
+        super(Constraints, self).extend(constraints)
+        self._is_possible = None
+
     def __iadd__(self, constraints: Iterable[Union[bool, Bool]]) -> "Constraints":
         """
 
         :param constraints:
         :return:
         """
-        list_constraints = self._get_smt_bool_list(constraints)
-        super(Constraints, self).__iadd__(list_constraints)
-        self._is_possible = None
+        self.extend(constraints)
         return self
 
     @staticmethod
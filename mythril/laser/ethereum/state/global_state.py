@@ -9,6 +9,7 @@ from mythril.laser.ethereum.cfg import Node
 from mythril.laser.ethereum.state.environment import Environment
 from mythril.laser.ethereum.state.machine_state import MachineState
 from mythril.laser.ethereum.state.annotation import StateAnnotation
+from mythril.laser.ethereum.state.transaction_stack import TransactionStack
 
 if TYPE_CHECKING:
     from mythril.laser.ethereum.state.world_state import WorldState
@@ -21,6 +22,17 @@ if TYPE_CHECKING:
 class GlobalState:
     """GlobalState represents the current globalstate."""
 
+    __slots__ = (
+        "node",
+        "world_state",
+        "environment",
+        "mstate",
+        "transaction_stack",
+        "op_code",
+        "last_return_data",
+        "_annotations",
+    )
+
     def __init__(
         self,
         world_state: "WorldState",
@@ -47,7 +59,9 @@ class GlobalState:
         self.mstate = (
             machine_state if machine_state else MachineState(gas_limit=1000000000)
         )
-        self.transaction_stack = transaction_stack if transaction_stack else []
+        self.transaction_stack = (
+            transaction_stack if transaction_stack else TransactionStack()
+        )  # type: TransactionStack
         self.op_code = ""
         self.last_return_data = last_return_data
         self._annotations = annotations or []
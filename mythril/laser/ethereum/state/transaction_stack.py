@@ -0,0 +1,93 @@
+"""This module contains the persistent stack used to represent the transaction
+stack of a global state."""
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+# A node is a (value, tail) pair, the empty stack is None
+_Node = Optional[Tuple[Any, Any]]
+
+
+class TransactionStack:
+    """A stack that shares its elements with the stacks it was copied from.
+
+    Nodes are immutable, so copying a stack and pushing an element are O(1);
+    copies of a global state only differ in the top elements they push.
+    """
+
+    __slots__ = "_top", "_size"
+
+    def __init__(self, items: Optional[Iterable] = None) -> None:
+        """
+
+        :param items: Initial elements, from bottom to top
+        """
+        self._top = None  # type: _Node
+        self._size = 0
+        for item in items or []:
+            self.append(item)
+
+    def append(self, item: Any) -> None:
+        """Pushes item on top of this stack.
+
+        :param item:
+        """
+        self._top = (item, self._top)
+        self._size += 1
+
+    def push(self, item: Any) -> "TransactionStack":
+        """Returns a copy of this stack with item pushed on top.
+
+        :param item:
+        :return:
+        """
+        stack = TransactionStack()
+        stack._top = (item, self._top)
+        stack._size = self._size + 1
+        return stack
+
+    def pop(self) -> Any:
+        """Removes and returns the top element of this stack.
+
+        :return:
+        """
+        if self._top is None:
+            raise IndexError("pop from empty transaction stack")
+        item, self._top = self._top
+        self._size -= 1
+        return item
+
+    def __getitem__(self, index: int) -> Any:
+        """Returns the element at index, negative indices count from the top.
+
+        :param index:
+        :return:
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("transaction stack index out of range")
+
+        node = self._top
+        for _ in range(self._size - 1 - index):
+            node = node[1]
+        return node[0]
+
+    def __iter__(self) -> Iterator:
+        """Iterates over the elements from bottom to top."""
+        items = []
+        node = self._top
+        while node is not None:
+            items.append(node[0])
+            node = node[1]
+        return reversed(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __copy__(self) -> "TransactionStack":
+        stack = TransactionStack()
+        stack._top = self._top
+        stack._size = self._size
+        return stack
+
+    def __repr__(self) -> str:
+        return "TransactionStack({})".format(list(self))
@@ -1,6 +1,6 @@
 """This module contains a representation of the EVM's world state."""
 from copy import copy
-from random import randint
+from random import getrandbits
 from typing import Dict, List, Iterator, Optional, TYPE_CHECKING
 
 from mythril.support.loader import DynLoader
@@ -18,6 +18,16 @@ class WorldState:
     """The WorldState class represents the world state as described in the
     yellow paper."""
 
+    __slots__ = (
+        "_accounts",
+        "balances",
+        "starting_balances",
+        "constraints",
+        "node",
+        "transaction_sequence",
+        "_annotations",
+    )
+
     def __init__(
         self,
         transaction_sequence=None,
@@ -176,12 +186,12 @@ class WorldState:
         """
         if creator:
             # TODO: Use nounce
-            address = "0x" + str(mk_contract_address(creator, 0).hex())
-            return symbol_factory.BitVecVal(int(address, 16), 256)
+            address = int(mk_contract_address(creator, 0).hex(), 16)
+            return symbol_factory.BitVecVal(address, 256)
         while True:
-            address = "0x" + "".join([str(hex(randint(0, 16)))[-1] for _ in range(40)])
-            if address not in self._accounts.keys():
-                return symbol_factory.BitVecVal(int(address, 16), 256)
+            address = getrandbits(160)
+            if address not in self._accounts:
+                return symbol_factory.BitVecVal(address, 256)
 
     def put_account(self, account: Account) -> None:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Deque
 from mythril.laser.ethereum.state.global_state import GlobalState
 
 
@@ -9,7 +9,7 @@ class BasicSearchStrategy(ABC):
     __slots__ = "work_list", "max_depth"
 
     def __init__(self, work_list, max_depth):
-        self.work_list = work_list  # type: List[GlobalState]
+        self.work_list = work_list  # type: Deque[GlobalState]
         self.max_depth = max_depth
 
     def __iter__(self):
@@ -20,6 +20,12 @@ class BasicSearchStrategy(ABC):
         """"""
         raise NotImplementedError("Must be implemented by a subclass")
 
+    def _pop_index(self, index: int) -> GlobalState:
+        """Removes and returns the state at index of the work list"""
+        global_state = self.work_list[index]
+        del self.work_list[index]
+        return global_state
+
     def __next__(self):
         try:
             global_state = self.get_strategic_global_state()
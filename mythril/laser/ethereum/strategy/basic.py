@@ -58,7 +58,7 @@ class BreadthFirstSearchStrategy(BasicSearchStrategy):
 
         :return:
         """
-        return self.work_list.pop(0)
+        return self.work_list.popleft()
 
 
 class ReturnRandomNaivelyStrategy(BasicSearchStrategy):
@@ -70,7 +70,7 @@ class ReturnRandomNaivelyStrategy(BasicSearchStrategy):
         :return:
         """
         if len(self.work_list) > 0:
-            return self.work_list.pop(randrange(len(self.work_list)))
+            return self._pop_index(randrange(len(self.work_list)))
         else:
             raise IndexError
 
@@ -87,6 +87,6 @@ class ReturnWeightedRandomStrategy(BasicSearchStrategy):
         probability_distribution = [
             1 / (global_state.mstate.depth + 1) for global_state in self.work_list
         ]
-        return self.work_list.pop(
+        return self._pop_index(
             choices(range(len(self.work_list)), probability_distribution)[0]
         )
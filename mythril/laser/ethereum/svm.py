@@ -1,9 +1,10 @@
 """This module implements the main symbolic execution engine."""
 import logging
-from collections import defaultdict
+import time
+from collections import deque
 from copy import copy
 from datetime import datetime, timedelta
-from typing import Callable, Dict, DefaultDict, List, Tuple, Optional
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from mythril.analysis.potential_issues import check_potential_issues
 from mythril.laser.ethereum.cfg import NodeFlags, Node, Edge, JumpType
@@ -28,11 +29,28 @@ from mythril.laser.ethereum.transaction import (
     execute_contract_creation,
     execute_message_call,
 )
-from mythril.laser.smt import symbol_factory
+from mythril.laser.smt import Bool, symbol_factory
 
 
 log = logging.getLogger(__name__)
 
+# The timeout in exec() is checked once every TIMEOUT_CHECK_MASK + 1 states
+TIMEOUT_CHECK_MASK = 63
+
+# Op codes after which successor states get a new CFG node, mapped to the edge
+# type, whether the edge is labelled with the branch condition and the minimum
+# number of successor states for a new node to be created
+CFG_EDGE_OPCODES = {
+    "JUMP": (JumpType.UNCONDITIONAL, False, 0),
+    "JUMPI": (JumpType.CONDITIONAL, True, 0),
+    "SLOAD": (JumpType.CONDITIONAL, True, 2),
+    "SSTORE": (JumpType.CONDITIONAL, True, 2),
+    "RETURN": (JumpType.RETURN, False, 0),
+}  # type: Dict[str, Tuple[JumpType, bool, int]]
+
+# An edge recorded during exec(): source uid, target uid, edge type and condition
+PendingEdge = Tuple[int, int, JumpType, Optional[Bool]]
+
 
 class SVMError(Exception):
     """An exception denoting an unexpected state in symbolic execution."""
@@ -81,8 +99,7 @@ class LaserEVM:
         self.total_states = 0
         self.dynamic_loader = dynamic_loader
 
-        # TODO: What about using a deque here?
-        self.work_list = []  # type: List[GlobalState]
+        self.work_list = deque()  # type: Deque[GlobalState]
         self.strategy = strategy(self.work_list, max_depth)
         self.max_depth = max_depth
         self.transaction_count = transaction_count
@@ -94,11 +111,16 @@ class LaserEVM:
         if self.requires_statespace:
             self.nodes = {}  # type: Dict[int, Node]
             self.edges = []  # type: List[Edge]
+            # Nodes and edges created during exec(), added to the above in bulk
+            self._pending_nodes = []  # type: List[Node]
+            self._pending_edges = []  # type: List[PendingEdge]
 
         self.time = None  # type: datetime
 
-        self.pre_hooks = defaultdict(list)  # type: DefaultDict[str, List[Callable]]
-        self.post_hooks = defaultdict(list)  # type: DefaultDict[str, List[Callable]]
+        self.pre_hooks = {}  # type: Dict[str, List[Callable]]
+        self.post_hooks = {}  # type: Dict[str, List[Callable]]
+        self._pre_hook_opcodes = frozenset()  # type: FrozenSet[str]
+        self._post_hook_opcodes = frozenset()  # type: FrozenSet[str]
 
         self._add_world_state_hooks = []  # type: List[Callable]
         self._execute_state_hooks = []  # type: List[Callable]
@@ -110,6 +132,7 @@ class LaserEVM:
         self._stop_sym_exec_hooks = []  # type: List[Callable]
 
         self.iprof = iprof
+        self._instruction_cache = {}  # type: Dict[str, Instruction]
 
         if enable_coverage_strategy:
             from mythril.laser.ethereum.plugins.implementations.coverage.coverage_strategy import (
@@ -225,43 +248,56 @@ class LaserEVM:
         :return:
         """
         final_states = []  # type: List[GlobalState]
-        for global_state in self.strategy:
-            if (
-                self.create_timeout
-                and create
-                and self.time + timedelta(seconds=self.create_timeout) <= datetime.now()
-            ):
-                log.debug("Hit create timeout, returning.")
-                return final_states + [global_state] if track_gas else None
-
-            if (
-                self.execution_timeout
-                and self.time + timedelta(seconds=self.execution_timeout)
-                <= datetime.now()
-                and not create
-            ):
-                log.debug("Hit execution timeout, returning.")
-                return final_states + [global_state] if track_gas else None
-
-            try:
-                new_states, op_code = self.execute_state(global_state)
-            except NotImplementedError:
-                log.debug("Encountered unimplemented instruction")
-                continue
-            new_states = [
-                state
-                for state in new_states
-                if state.world_state.constraints.is_possible
-            ]
+        deadline = self._get_deadline(
+            self.create_timeout if create else self.execution_timeout
+        )
+        # Bind attributes used on every iteration to locals
+        monotonic = time.monotonic
+        work_list = self.work_list
+        execute_state = self.execute_state
+        manage_cfg = self.manage_cfg
 
-            self.manage_cfg(op_code, new_states)  # TODO: What about op_code is None?
-            if new_states:
-                self.work_list += new_states
-            elif track_gas:
-                final_states.append(global_state)
-            self.total_states += len(new_states)
+        try:
+            for step, global_state in enumerate(self.strategy):
+                if step & TIMEOUT_CHECK_MASK == 0 and monotonic() >= deadline:
+                    log.debug(
+                        "Hit %s timeout, returning.",
+                        "create" if create else "execution",
+                    )
+                    return final_states + [global_state] if track_gas else None
 
-        return final_states if track_gas else None
+                try:
+                    new_states, op_code = execute_state(global_state)
+                except NotImplementedError:
+                    log.debug("Encountered unimplemented instruction")
+                    continue
+                new_states = [
+                    state
+                    for state in new_states
+                    if state.world_state.constraints.is_possible
+                ]
+
+                manage_cfg(op_code, new_states)  # TODO: What about op_code is None?
+                if new_states:
+                    work_list.extend(new_states)
+                elif track_gas:
+                    final_states.append(global_state)
+                self.total_states += len(new_states)
+
+            return final_states if track_gas else None
+        finally:
+            self._flush_statespace()
+
+    def _get_deadline(self, timeout: Optional[float]) -> float:
+        """Converts a timeout relative to self.time into a monotonic clock deadline
+
+        :param timeout: Timeout in seconds
+        :return: Deadline comparable with time.monotonic()
+        """
+        if not timeout:
+            return float("inf")
+        remaining = self.time + timedelta(seconds=timeout) - datetime.now()
+        return time.monotonic() + remaining.total_seconds()
 
     def _add_world_state(self, global_state: GlobalState):
         """ Stores the world_state of the passed global state in the open states"""
@@ -305,10 +341,10 @@ class LaserEVM:
         for hook in self._execute_state_hooks:
             hook(global_state)
 
-        instructions = global_state.environment.code.instruction_list
+        code = global_state.environment.code
 
         try:
-            op_code = instructions[global_state.mstate.pc]["opcode"]
+            op_code = code.opcode_array[global_state.mstate.pc]
         except IndexError:
             self._add_world_state(global_state)
             return [], None
@@ -316,7 +352,7 @@ class LaserEVM:
             error_msg = (
                 "Stack Underflow Exception due to insufficient "
                 "stack elements for the address {}".format(
-                    instructions[global_state.mstate.pc]["address"]
+                    code.instruction_list[global_state.mstate.pc]["address"]
                 )
             )
             new_global_states = self.handle_vm_exception(
@@ -332,9 +368,7 @@ class LaserEVM:
             return [], None
 
         try:
-            new_global_states = Instruction(
-                op_code, self.dynamic_loader, self.iprof
-            ).evaluate(global_state)
+            new_global_states = self._get_instruction(op_code).evaluate(global_state)
 
         except VmException as e:
             new_global_states = self.handle_vm_exception(global_state, op_code, str(e))
@@ -343,9 +377,9 @@ class LaserEVM:
             # Setup new global state
             new_global_state = start_signal.transaction.initial_global_state()
 
-            new_global_state.transaction_stack = copy(
-                global_state.transaction_stack
-            ) + [(start_signal.transaction, global_state)]
+            new_global_state.transaction_stack = global_state.transaction_stack.push(
+                (start_signal.transaction, global_state)
+            )
             new_global_state.node = global_state.node
             new_global_state.world_state.constraints = (
                 start_signal.global_state.world_state.constraints
@@ -400,6 +434,19 @@ class LaserEVM:
 
         return new_global_states, op_code
 
+    def _get_instruction(self, op_code: str) -> Instruction:
+        """Returns the cached Instruction object for op_code, Instructions are stateless
+
+        :param op_code:
+        :return:
+        """
+        try:
+            return self._instruction_cache[op_code]
+        except KeyError:
+            instruction = Instruction(op_code, self.dynamic_loader, self.iprof)
+            self._instruction_cache[op_code] = instruction
+            return instruction
+
     def _end_message_call(
         self,
         return_global_state: GlobalState,
@@ -416,13 +463,13 @@ class LaserEVM:
         :return:
         """
 
-        return_global_state.world_state.constraints += (
+        return_global_state.world_state.constraints.extend(
             global_state.world_state.constraints
         )
         # Resume execution of the transaction initializing instruction
-        op_code = return_global_state.environment.code.instruction_list[
+        op_code = return_global_state.environment.code.opcode_array[
             return_global_state.mstate.pc
-        ]["opcode"]
+        ]
 
         # Set execution result in the return_state
         return_global_state.last_return_data = return_data
@@ -442,9 +489,9 @@ class LaserEVM:
                 )
 
         # Execute the post instruction handler
-        new_global_states = Instruction(
-            op_code, self.dynamic_loader, self.iprof
-        ).evaluate(return_global_state, True)
+        new_global_states = self._get_instruction(op_code).evaluate(
+            return_global_state, True
+        )
 
         # In order to get a nice call graph we need to set the nodes here
         for state in new_global_states:
@@ -458,27 +505,55 @@ class LaserEVM:
         :param opcode:
         :param new_states:
         """
-        if opcode == "JUMP":
-            assert len(new_states) <= 1
-            for state in new_states:
-                self._new_node_state(state)
-        elif opcode == "JUMPI":
-            assert len(new_states) <= 2
-            for state in new_states:
-                self._new_node_state(
-                    state, JumpType.CONDITIONAL, state.world_state.constraints[-1]
-                )
-        elif opcode in ("SLOAD", "SSTORE") and len(new_states) > 1:
-            for state in new_states:
-                self._new_node_state(
-                    state, JumpType.CONDITIONAL, state.world_state.constraints[-1]
-                )
-        elif opcode == "RETURN":
-            for state in new_states:
-                self._new_node_state(state, JumpType.RETURN)
+        edge = CFG_EDGE_OPCODES.get(opcode)
+        if edge is None or len(new_states) < edge[2]:
+            self._add_states_to_nodes(new_states)
+            return
+        edge_type, is_conditional, _ = edge
+        assert opcode != "JUMP" or len(new_states) <= 1
+        assert opcode != "JUMPI" or len(new_states) <= 2
 
+        # Link every state to its new node and record it there in a single pass
         for state in new_states:
+            self._new_node_state(
+                state,
+                edge_type,
+                state.world_state.constraints[-1] if is_conditional else None,
+            )
+            state.node.states.append(state)
+
+    @staticmethod
+    def _add_states_to_nodes(new_states: List[GlobalState]) -> None:
+        """Records the states on the CFG nodes they belong to
+
+        :param new_states:
+        """
+        if len(new_states) == 1:
+            state = new_states[0]
             state.node.states.append(state)
+            return
+
+        # Successors that do not start a new node mostly share their parent's node
+        node_states = {}  # type: Dict[int, Tuple[Node, List[GlobalState]]]
+        for state in new_states:
+            try:
+                node_states[id(state.node)][1].append(state)
+            except KeyError:
+                node_states[id(state.node)] = (state.node, [state])
+        for node, states in node_states.values():
+            node.states.extend(states)
+
+    def _flush_statespace(self) -> None:
+        """Adds the nodes and edges recorded by _new_node_state to the statespace."""
+        if not self.requires_statespace:
+            return
+        self.nodes.update((node.uid, node) for node in self._pending_nodes)
+        self.edges.extend(
+            Edge(node_from, node_to, edge_type=edge_type, condition=condition)
+            for node_from, node_to, edge_type, condition in self._pending_edges
+        )
+        self._pending_nodes.clear()
+        self._pending_edges.clear()
 
     def _new_node_state(
         self, state: GlobalState, edge_type=JumpType.UNCONDITIONAL, condition=None
@@ -494,11 +569,9 @@ class LaserEVM:
         state.node = new_node
         new_node.constraints = state.world_state.constraints
         if self.requires_statespace:
-            self.nodes[new_node.uid] = new_node
-            self.edges.append(
-                Edge(
-                    old_node.uid, new_node.uid, edge_type=edge_type, condition=condition
-                )
+            self._pending_nodes.append(new_node)
+            self._pending_edges.append(
+                (old_node.uid, new_node.uid, edge_type, condition)
             )
 
         if edge_type == JumpType.RETURN:
@@ -554,7 +627,18 @@ class LaserEVM:
             )
 
         for op_code, funcs in hook_dict.items():
-            entrypoint[op_code].extend(funcs)
+            entrypoint.setdefault(op_code, []).extend(funcs)
+
+        self._refresh_hook_opcodes()
+
+    def _refresh_hook_opcodes(self) -> None:
+        """Updates the sets of op codes that have pre or post hooks registered"""
+        self._pre_hook_opcodes = frozenset(
+            op_code for op_code, hooks in self.pre_hooks.items() if hooks
+        )
+        self._post_hook_opcodes = frozenset(
+            op_code for op_code, hooks in self.post_hooks.items() if hooks
+        )
 
     def register_laser_hooks(self, hook_type: str, hook: Callable):
         """registers the hook with this Laser VM"""
@@ -599,9 +683,9 @@ class LaserEVM:
         :param global_state:
         :return:
         """
-        if op_code not in self.pre_hooks.keys():
+        if op_code not in self._pre_hook_opcodes:
             return
-        for hook in self.pre_hooks[op_code]:
+        for hook in self.pre_hooks.get(op_code, ()):
             hook(global_state)
 
     def _execute_post_hook(
@@ -613,15 +697,22 @@ class LaserEVM:
         :param global_states:
         :return:
         """
-        if op_code not in self.post_hooks.keys():
+        if op_code not in self._post_hook_opcodes:
             return
 
-        for hook in self.post_hooks[op_code]:
+        for hook in self.post_hooks.get(op_code, ()):
+            skipped_states = set()  # type: Set[int]
             for global_state in global_states:
                 try:
                     hook(global_state)
                 except PluginSkipState:
-                    global_states.remove(global_state)
+                    skipped_states.add(id(global_state))
+            if skipped_states:
+                global_states[:] = [
+                    global_state
+                    for global_state in global_states
+                    if id(global_state) not in skipped_states
+                ]
 
     def pre_hook(self, op_code: str) -> Callable:
         """
@@ -636,9 +727,8 @@ class LaserEVM:
             :param func:
             :return:
             """
-            if op_code not in self.pre_hooks.keys():
-                self.pre_hooks[op_code] = []
-            self.pre_hooks[op_code].append(func)
+            self.pre_hooks.setdefault(op_code, []).append(func)
+            self._refresh_hook_opcodes()
             return func
 
         return hook_decorator
@@ -656,9 +746,8 @@ class LaserEVM:
             :param func:
             :return:
             """
-            if op_code not in self.post_hooks.keys():
-                self.post_hooks[op_code] = []
-            self.post_hooks[op_code].append(func)
+            self.post_hooks.setdefault(op_code, []).append(func)
+            self._refresh_hook_opcodes()
             return func
 
         return hook_decorator
@@ -1,3 +1,4 @@
 from mythril.laser.smt.solver.solver import Solver, Optimize, BaseSolver
 from mythril.laser.smt.solver.independence_solver import IndependenceSolver
+from mythril.laser.smt.solver.incremental_solver import IncrementalSolver
 from mythril.laser.smt.solver.solver_statistics import SolverStatistics
@@ -0,0 +1,146 @@
+"""This module contains an SMT solver that reuses assertions shared by consecutive
+queries."""
+import time
+from typing import List, Optional, Sequence, Set
+
+import z3
+
+from mythril.laser.smt.bool import Bool
+from mythril.laser.smt.solver.solver import Solver
+
+# Bit-vector operations whose incremental processing ignores the solver timeout
+# when both operands are symbolic
+NONLINEAR_OPS = {
+    z3.Z3_OP_BMUL,
+    z3.Z3_OP_BSDIV,
+    z3.Z3_OP_BUDIV,
+    z3.Z3_OP_BSREM,
+    z3.Z3_OP_BUREM,
+    z3.Z3_OP_BSMOD,
+}
+
+
+def is_nonlinear(expression: z3.ExprRef) -> bool:
+    """Checks whether the expression multiplies or divides two symbolic terms.
+
+    :param expression: The z3 expression to inspect
+    :return: True if the expression contains nonlinear arithmetic
+    """
+    todo = [expression]
+    visited = set()  # type: Set[int]
+    while todo:
+        term = todo.pop()
+        if term.get_id() in visited or not z3.is_app(term):
+            continue
+        visited.add(term.get_id())
+        children = term.children()
+        if (
+            term.decl().kind() in NONLINEAR_OPS
+            and sum(not z3.is_bv_value(child) for child in children) > 1
+        ):
+            return True
+        todo.extend(children)
+    return False
+
+
+class IncrementalSolver(Solver):
+    """An SMT solver that keeps one backtracking point per asserted constraint.
+
+    Consecutive queries during symbolic execution mostly come from states on the
+    same path, so they share a long prefix of constraints. Only the constraints
+    after the common prefix are popped and asserted again, the rest stay in the
+    solver together with everything z3 learned about them.
+
+    z3's incremental core does not honour the timeout while it processes new
+    nonlinear bit-vector terms. Queries with such terms are answered by a fresh
+    solver instead. If an incremental check still returns unknown or runs past
+    the timeout, the solver is reset and later queries containing the
+    constraints asserted for that check are also answered by a fresh solver.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+        self._asserted = []  # type: List[z3.BoolRef]
+        self._timeout = None  # type: Optional[int]
+        # AST ids of constraints that are not checked incrementally
+        self._unsuitable = set()  # type: Set[int]
+
+    def set_timeout(self, timeout: int) -> None:
+        """Sets the timeout that will be used by this solver, timeout is in
+        milliseconds.
+
+        :param timeout:
+        """
+        super().set_timeout(timeout)
+        self._timeout = timeout
+
+    def reset(self) -> None:
+        """Reset this solver."""
+        super().reset()
+        self._asserted = []
+
+    def check_constraints(self, constraints: Sequence[Bool]) -> z3.CheckSatResult:
+        """Checks the satisfiability of exactly the passed constraints.
+
+        :param constraints: The constraints to check
+        :return: The evaluated result which is either of sat, unsat or unknown
+        """
+        raw_constraints = [
+            z3.BoolVal(constraint.raw)
+            if isinstance(constraint.raw, bool)
+            else constraint.raw
+            for constraint in constraints
+        ]
+        if self._unsuitable and any(
+            constraint.get_id() in self._unsuitable for constraint in raw_constraints
+        ):
+            return self._check_fresh(raw_constraints)
+
+        common_prefix = 0
+        for asserted, constraint in zip(self._asserted, raw_constraints):
+            if not asserted.eq(constraint):
+                break
+            common_prefix += 1
+
+        nonlinear = [
+            constraint.get_id()
+            for constraint in raw_constraints[common_prefix:]
+            if is_nonlinear(constraint)
+        ]
+        if nonlinear:
+            self._unsuitable.update(nonlinear)
+            return self._check_fresh(raw_constraints)
+
+        if common_prefix < len(self._asserted):
+            self.pop(len(self._asserted) - common_prefix)
+            del self._asserted[common_prefix:]
+
+        for constraint in raw_constraints[common_prefix:]:
+            self.push()
+            self.raw.add(constraint)
+            self._asserted.append(constraint)
+
+        start = time.monotonic()
+        result = self.check()
+        elapsed = (time.monotonic() - start) * 1000
+        if result == z3.unknown or (self._timeout and elapsed > self._timeout):
+            self._unsuitable.update(
+                constraint.get_id() for constraint in raw_constraints[common_prefix:]
+            )
+            self.reset()
+            if result == z3.unknown:
+                result = self._check_fresh(raw_constraints)
+        return result
+
+    def _check_fresh(self, raw_constraints: List[z3.BoolRef]) -> z3.CheckSatResult:
+        """Checks the constraints with a new, non-incremental solver.
+
+        :param raw_constraints: The z3 constraints to check
+        :return: The evaluated result which is either of sat, unsat or unknown
+        """
+        solver = Solver()
+        if self._timeout is not None:
+            solver.set_timeout(self._timeout)
+        solver.raw.add(raw_constraints)
+        return solver.check()
@@ -75,6 +75,10 @@ class Solver(BaseSolver[z3.Solver]):
         """Reset this solver."""
         self.raw.reset()
 
+    def push(self) -> None:
+        """Create a backtracking point in this solver."""
+        self.raw.push()
+
     def pop(self, num: int) -> None:
         """Pop num constraints from this solver.
 
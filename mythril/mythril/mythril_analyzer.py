@@ -17,6 +17,7 @@ from mythril.analysis.security import fire_lasers, retrieve_callback_issues
 from mythril.analysis.report import Report, Issue
 from mythril.ethereum.evmcontract import EVMContract
 from mythril.laser.smt import SolverStatistics
+from mythril.support.sat_cache import sat_cache
 from mythril.support.start_time import StartTime
 
 log = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ class MythrilAnalyzer:
         disable_dependency_pruning: bool = False,
         solver_timeout: Optional[int] = None,
         enable_coverage_strategy: bool = False,
+        enable_sat_cache: bool = False,
         custom_modules_directory: str = "",
     ):
         """
@@ -50,6 +52,7 @@ class MythrilAnalyzer:
         :param disassembler: The MythrilDisassembler class
         :param requires_dynld: whether dynamic loading should be done or not
         :param onchain_storage_access: Whether onchain access should be done or not
+        :param enable_sat_cache: Whether satisfiability results should be cached on disk
         """
         self.eth = disassembler.eth
         self.contracts = disassembler.contracts or []  # type: List[EVMContract]
@@ -69,6 +72,8 @@ class MythrilAnalyzer:
 
         analysis_args.set_loop_bound(loop_bound)
         analysis_args.set_solver_timeout(solver_timeout)
+        if enable_sat_cache:
+            sat_cache.enable(persist=True)
 
     def dump_statespace(self, contract: EVMContract = None) -> str:
         """
@@ -0,0 +1,169 @@
+"""This module contains a cache for the satisfiability results of constraint sets."""
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from typing import Iterable, Optional, Union
+
+import z3
+
+log = logging.getLogger(__name__)
+
+# Number of pending inserts after which the on-disk store is committed
+COMMIT_INTERVAL = 128
+
+
+class SatCache(object):
+    """Caches whether a set of constraints is satisfiable.
+
+    Results are keyed by a hash over the s-expressions of the constraints and the
+    z3 version. The cache is disabled until enable() is called. An in-memory LRU
+    map is consulted first; if persistence is enabled, results are also written
+    through to an SQLite database so that subsequent runs can skip queries that
+    were already decided. If the database cannot be used, e.g. because another
+    run holds a lock on it, the cache falls back to keeping results in memory.
+
+    Use the module level sat_cache instance.
+    """
+
+    def __init__(self, max_size: int = 1 << 17) -> None:
+        """
+
+        :param max_size: Maximum number of results kept in memory
+        """
+        self.enabled = False
+        self.max_size = max_size
+        self.path = None  # type: Optional[str]
+        self._results = OrderedDict()  # type: OrderedDict[bytes, bool]
+        self._conn = None  # type: Optional[sqlite3.Connection]
+        self._pending_writes = 0
+        self._version = z3.get_version_string().encode()
+
+    def enable(self, persist: bool = False, path: str = None) -> None:
+        """Enables the cache.
+
+        :param persist: Whether results should be stored on disk
+        :param path: Path of the on-disk store, defaults to $MYTHRIL_DIR/sat_cache.db
+        """
+        self.enabled = True
+        if not persist or self._conn is not None:
+            return
+
+        if path is None:
+            path = os.path.join(
+                os.environ.get("MYTHRIL_DIR")
+                or os.path.join(os.path.expanduser("~"), ".mythril"),
+                "sat_cache.db",
+            )
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        log.info("Using satisfiability cache at %s", self.path)
+        try:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sat_cache"
+                "(key BLOB PRIMARY KEY, is_possible INTEGER)"
+            )
+        except sqlite3.OperationalError as e:
+            self._disable_persistence(e)
+            return
+        atexit.register(self.flush)
+
+    def get_key(self, constraints: Iterable[Union[bool, z3.BoolRef]]) -> bytes:
+        """Computes the cache key for the given raw z3 constraints.
+
+        :param constraints: Raw constraints, concrete ones may be python bools
+        :return:
+        """
+        key = hashlib.sha256(self._version)
+        for constraint in constraints:
+            if isinstance(constraint, bool):
+                constraint = z3.BoolVal(constraint)
+            key.update(b"\0")
+            key.update(constraint.sexpr().encode())
+        return key.digest()
+
+    def get(self, key: bytes) -> Optional[bool]:
+        """Looks up a satisfiability result.
+
+        :param key: Key as returned by get_key
+        :return: The cached result, or None if the key is unknown
+        """
+        try:
+            result = self._results[key]
+            self._results.move_to_end(key)
+            return result
+        except KeyError:
+            pass
+
+        if self._conn is None:
+            return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT is_possible FROM sat_cache WHERE key=?", (key,)
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            self._disable_persistence(e)
+            return None
+        if row is None:
+            return None
+        result = bool(row[0])
+        self._remember(key, result)
+        return result
+
+    def add(self, key: bytes, is_possible: bool) -> None:
+        """Stores a satisfiability result.
+
+        :param key: Key as returned by get_key
+        :param is_possible: Whether the constraints are satisfiable
+        """
+        self._remember(key, is_possible)
+        if self._conn is None:
+            return
+
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sat_cache (key, is_possible) VALUES (?,?)",
+                (key, int(is_possible)),
+            )
+        except sqlite3.OperationalError as e:
+            self._disable_persistence(e)
+            return
+        self._pending_writes += 1
+        if self._pending_writes >= COMMIT_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commits pending results to the on-disk store."""
+        if self._conn is None or not self._pending_writes:
+            return
+        try:
+            self._conn.commit()
+        except sqlite3.OperationalError as e:
+            self._disable_persistence(e)
+            return
+        self._pending_writes = 0
+
+    def _disable_persistence(self, error: sqlite3.OperationalError) -> None:
+        log.warning(
+            "Unable to use the satisfiability cache at %s (%s), "
+            "keeping results in memory only",
+            self.path,
+            error,
+        )
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._pending_writes = 0
+
+    def _remember(self, key: bytes, is_possible: bool) -> None:
+        self._results[key] = is_possible
+        if len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+
+sat_cache = SatCache()
@@ -0,0 +1,26 @@
+from unittest.mock import MagicMock
+
+from mythril.laser.ethereum.plugins.signals import PluginSkipState
+from mythril.laser.ethereum.svm import LaserEVM
+
+
+def test_consecutive_skipped_states_are_dropped():
+    # Arrange
+    laser = LaserEVM()
+    states = [MagicMock(skip=skip) for skip in (False, True, True, False, True)]
+    seen_states = []
+
+    @laser.post_hook("SSTORE")
+    def skip_marked_states(global_state):
+        seen_states.append(global_state)
+        if global_state.skip:
+            raise PluginSkipState
+
+    global_states = list(states)
+
+    # Act
+    laser._execute_post_hook("SSTORE", global_states)
+
+    # Assert
+    assert seen_states == states
+    assert global_states == [states[0], states[3]]
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from mythril.laser.smt.solver.incremental_solver import IncrementalSolver, is_nonlinear
+from mythril.laser.smt import symbol_factory, UDiv
+
+import z3
+
+
+def test_incremental_solver_backtracks_to_common_prefix():
+    # Arrange
+    solver = IncrementalSolver()
+    x = symbol_factory.BitVecSym("x", 256)
+    prefix = [x > 5]
+
+    # Act
+    first = solver.check_constraints(prefix + [x < 3])
+    second = solver.check_constraints(prefix + [x < 9])
+
+    # Assert
+    assert first == z3.unsat
+    assert second == z3.sat
+    assert len(solver.raw.assertions()) == 2
+
+
+def test_incremental_solver_shorter_query():
+    # Arrange
+    solver = IncrementalSolver()
+    x = symbol_factory.BitVecSym("x", 256)
+
+    # Act
+    first = solver.check_constraints([x > 5, x < 3])
+    second = solver.check_constraints([x < 3])
+
+    # Assert
+    assert first == z3.unsat
+    assert second == z3.sat
+    assert len(solver.raw.assertions()) == 1
+
+
+def test_is_nonlinear():
+    x = symbol_factory.BitVecSym("x", 256)
+    y = symbol_factory.BitVecSym("y", 256)
+
+    assert is_nonlinear((UDiv(x * y, x) == y).raw)
+    assert not is_nonlinear((x * symbol_factory.BitVecVal(3, 256) + y > 5).raw)
+
+
+def test_incremental_solver_checks_nonlinear_query_with_fresh_solver():
+    # Arrange
+    solver = IncrementalSolver()
+    x = symbol_factory.BitVecSym("x", 256)
+    y = symbol_factory.BitVecSym("y", 256)
+    solver.check_constraints([x > 5])
+
+    # Act
+    result = solver.check_constraints([x > 5, x * y == 12])
+
+    # Assert
+    assert result == z3.sat
+    assert len(solver.raw.assertions()) == 1
+
+
+def test_incremental_solver_resets_after_unknown():
+    # Arrange
+    solver = IncrementalSolver()
+    solver.set_timeout(100)
+    x = symbol_factory.BitVecSym("x", 256)
+
+    # Act
+    with patch.object(solver, "check", return_value=z3.unknown) as check:
+        first = solver.check_constraints([x > 5])
+        second = solver.check_constraints([x > 5, x < 9])
+
+    # Assert
+    assert first == z3.sat
+    assert second == z3.sat
+    assert check.call_count == 1
+    assert len(solver.raw.assertions()) == 0
@@ -0,0 +1,53 @@
+from mythril.laser.ethereum.state.constraints import Constraints
+from mythril.laser.smt import symbol_factory, Not
+
+
+def test_negated_constraint_is_trivially_unsat():
+    # Arrange
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints()
+    constraints.append(x > 5)
+    constraints.append(x != 7)
+
+    # Act
+    constraints.append(Not(x > 5))
+
+    # Assert
+    assert Constraints._is_trivially_unsat(constraints)
+    assert not constraints.is_possible
+
+
+def test_unrelated_constraint_is_not_trivially_unsat():
+    # Arrange
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints()
+    constraints.append(x > 5)
+
+    # Act
+    constraints.append(x < 9)
+
+    # Assert
+    assert not Constraints._is_trivially_unsat(constraints)
+    assert constraints.is_possible
+
+
+def test_concrete_false_is_trivially_unsat():
+    constraints = Constraints([False])
+
+    assert Constraints._is_trivially_unsat(constraints)
+    assert not constraints.is_possible
+
+
+def test_extend_converts_bools_and_resets_is_possible():
+    # Arrange
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints()
+    constraints.append(x > 5)
+    assert constraints.is_possible
+
+    # Act
+    constraints.extend([False])
+
+    # Assert
+    assert len(constraints) == 2
+    assert not constraints.is_possible
@@ -0,0 +1,40 @@
+from copy import copy
+
+import pytest
+
+from mythril.laser.ethereum.state.transaction_stack import TransactionStack
+
+
+def test_transaction_stack_behaves_like_list():
+    stack = TransactionStack()
+    stack.append(1)
+    stack.append(2)
+
+    assert len(stack) == 2
+    assert stack[-1] == 2
+    assert stack[0] == 1
+    assert list(stack) == [1, 2]
+    assert stack.pop() == 2
+    assert list(stack) == [1]
+
+
+def test_transaction_stack_copies_are_independent():
+    stack = TransactionStack([1, 2])
+
+    copied = copy(stack)
+    copied.append(3)
+    pushed = stack.push(4)
+
+    assert list(stack) == [1, 2]
+    assert list(copied) == [1, 2, 3]
+    assert list(pushed) == [1, 2, 4]
+
+
+def test_empty_transaction_stack():
+    stack = TransactionStack()
+
+    assert not stack
+    with pytest.raises(IndexError):
+        stack.pop()
+    with pytest.raises(IndexError):
+        stack[-1]
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+
+from mythril.analysis.potential_issues import (
+    PotentialIssue,
+    check_potential_issues,
+    get_potential_issues_annotation,
+)
+from mythril.exceptions import UnsatError
+from mythril.laser.ethereum.state.global_state import GlobalState
+from mythril.laser.ethereum.state.world_state import WorldState
+
+
+def _potential_issue(detector, address, satisfiable):
+    return PotentialIssue(
+        contract="Test",
+        function_name="test()",
+        address=address,
+        swc_id="101",
+        title="Title",
+        bytecode="0x00",
+        detector=detector,
+        constraints=[satisfiable],
+    )
+
+
+def _get_transaction_sequence(state, constraints):
+    if not constraints[-1].raw:
+        raise UnsatError
+    return {}
+
+
+def test_consecutive_satisfiable_issues_are_reported():
+    # Arrange
+    detector = MagicMock(cache=set(), issues=[])
+    state = GlobalState(WorldState(), MagicMock(), None)
+    annotation = get_potential_issues_annotation(state)
+    potential_issues = [
+        _potential_issue(detector, 1, True),
+        _potential_issue(detector, 2, True),
+        _potential_issue(detector, 3, False),
+        _potential_issue(detector, 4, False),
+        _potential_issue(detector, 5, True),
+    ]
+    annotation.potential_issues.extend(potential_issues)
+
+    # Act
+    with patch(
+        "mythril.analysis.potential_issues.get_transaction_sequence",
+        side_effect=_get_transaction_sequence,
+    ):
+        check_potential_issues(state)
+
+    # Assert
+    assert [issue.address for issue in detector.issues] == [1, 2, 5]
+    assert detector.cache == {1, 2, 5}
+    assert annotation.potential_issues == potential_issues[2:4]
@@ -0,0 +1,133 @@
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import z3
+
+import mythril.laser.ethereum.state.constraints as constraints_module
+from mythril.laser.ethereum.state.constraints import Constraints
+from mythril.laser.smt import symbol_factory
+from mythril.support.sat_cache import SatCache
+
+
+def test_persisted_result_is_read_back(tmp_path):
+    # Arrange
+    path = str(tmp_path / "sat_cache.db")
+    cache = SatCache()
+    cache.enable(persist=True, path=path)
+    key = cache.get_key([z3.Int("x") > 5])
+
+    # Act
+    cache.add(key, False)
+    cache.flush()
+    other_cache = SatCache()
+    other_cache.enable(persist=True, path=path)
+
+    # Assert
+    assert other_cache.get(key) is False
+    row = (
+        sqlite3.connect(path)
+        .execute("SELECT is_possible FROM sat_cache WHERE key=?", (key,))
+        .fetchone()
+    )
+    assert row == (0,)
+
+
+def test_locked_database_falls_back_to_memory(tmp_path):
+    # Arrange
+    cache = SatCache()
+    error = sqlite3.OperationalError("database is locked")
+
+    # Act
+    with patch("sqlite3.connect", side_effect=error):
+        cache.enable(persist=True, path=str(tmp_path / "sat_cache.db"))
+    cache.add(b"a", True)
+
+    # Assert
+    assert cache.enabled
+    assert cache.get(b"a") is True
+
+
+def test_least_recently_used_result_is_evicted():
+    # Arrange
+    cache = SatCache(max_size=2)
+    cache.enable()
+    cache.add(b"a", True)
+    cache.add(b"b", True)
+    cache.get(b"a")
+
+    # Act
+    cache.add(b"c", False)
+
+    # Assert
+    assert cache.get(b"a") is True
+    assert cache.get(b"b") is None
+    assert cache.get(b"c") is False
+
+
+def test_get_key_accepts_python_bools():
+    cache = SatCache()
+    x = z3.Int("x")
+
+    assert cache.get_key([True, x > 5]) == cache.get_key([z3.BoolVal(True), x > 5])
+    assert cache.get_key([True, x > 5]) != cache.get_key([False, x > 5])
+
+
+def test_is_possible_uses_cached_result():
+    # Arrange
+    cache = SatCache()
+    cache.enable()
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints([True])
+    constraints.append(x > 5)
+    cache.add(cache.get_key(c.raw for c in constraints), False)
+    solver = MagicMock()
+
+    # Act
+    with patch.object(constraints_module, "sat_cache", cache):
+        with patch.object(
+            constraints_module, "get_incremental_solver", return_value=solver
+        ):
+            result = constraints.is_possible
+
+    # Assert
+    assert result is False
+    solver.check_constraints.assert_not_called()
+
+
+def test_is_possible_stores_decided_result():
+    # Arrange
+    cache = SatCache()
+    cache.enable()
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints([True])
+    constraints.append(x > 5)
+
+    # Act
+    with patch.object(constraints_module, "sat_cache", cache):
+        result = constraints.is_possible
+
+    # Assert
+    assert result is True
+    assert cache.get(cache.get_key(c.raw for c in constraints)) is True
+
+
+def test_is_possible_does_not_store_unknown_result():
+    # Arrange
+    cache = SatCache()
+    cache.enable()
+    x = symbol_factory.BitVecSym("x", 256)
+    constraints = Constraints()
+    constraints.append(x > 5)
+    solver = MagicMock()
+    solver.check_constraints.return_value = z3.unknown
+
+    # Act
+    with patch.object(constraints_module, "sat_cache", cache):
+        with patch.object(
+            constraints_module, "get_incremental_solver", return_value=solver
+        ):
+            result = constraints.is_possible
+
+    # Assert
+    assert result is True
+    assert cache.get(cache.get_key(c.raw for c in constraints)) is None